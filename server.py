@@ -1,58 +1,40 @@
 import contextlib
 import logging
 import os
-import json
-from collections.abc import AsyncIterator
+import sys
+from collections.abc import AsyncIterator, Awaitable, Callable
+from operator import itemgetter
 from typing import Any, Dict, List
 import asyncio
 
 import click
+import orjson
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import best_match
 import mcp.types as types
 from mcp.server.lowlevel import Server
 from mcp.server.sse import SseServerTransport
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from pydantic import PrivateAttr
 from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.responses import Response
 from starlette.routing import Mount, Route
 from starlette.types import Receive, Scope, Send
 from dotenv import load_dotenv
 
+# Load .env once, before the tools package reads its settings at import
+load_dotenv()
+
+import tools
 from tools import (
-    # base.py
+    MUTATING_TOOLS,
+    READ_ONLY_TOOLS,
+    WEBHOOK_TRIGGERS,
     auth_token_context,
-
-    # schedule.py
-    cal_get_all_schedules,
-    cal_create_a_schedule,
-    cal_update_a_schedule,
-    cal_get_default_schedule,
-    cal_get_schedule,
-    cal_delete_a_schedule,
-
-    # stripe.py (Not able to test)
-    # cal_get_stripe_connect_url,
-    # cal_save_stripe_credentials,
-    # cal_check_stripe_connection,
-
-    # verified_resources.py
-    cal_request_email_verification_code,
-    cal_verify_email_code,
-    cal_get_verified_emails,
-    cal_get_verified_email_by_id,
-
-    # Phone verification functions not working (tested with Indian numbers)
-    # 'cal_request_phone_verification_code',
-    # 'cal_verify_phone_code',
-
-    cal_get_verified_phones,
-    cal_get_verified_phone_by_id,
-
-    # webhooks.py
-    cal_get_all_webhooks,
-    cal_create_webhook,
-    cal_get_webhook,
-    cal_update_webhook,
-    cal_delete_webhook
+    close_http_client,
+    warm_http_client,
 )
 
 
@@ -60,10 +42,745 @@ from tools import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
-load_dotenv()
-
 CAL_COM_MCP_SERVER_PORT = int(os.getenv("CAL_COM_MCP_SERVER_PORT", "5000"))
 
+# Webhook argument schemas, shared by the single and bulk webhook tools
+_CREATE_WEBHOOK_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "active": {
+            "type": "boolean",
+            "description": "Whether the webhook is active"
+        },
+        "subscriberUrl": {
+            "type": "string",
+            "description": "URL to receive webhook payloads",
+            "format": "uri"
+        },
+        "triggers": {
+            "type": "array",
+            "description": "List of trigger events",
+            "items": {
+                "type": "string",
+                "enum": list(WEBHOOK_TRIGGERS)
+            }
+        },
+        "payloadTemplate": {
+            "type": "string",
+            "description": "Custom payload template (JSON string with Liquid variables)"
+        },
+        "secret": {
+            "type": "string",
+            "description": "Secret for verifying webhooks"
+        }
+    },
+    "required": ["active", "subscriberUrl", "triggers"]
+}
+
+_UPDATE_WEBHOOK_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "webhook_id": {
+            "type": "string",
+            "description": "ID of the webhook to update"
+        },
+        "active": {
+            "type": "boolean",
+            "description": "Whether the webhook is active"
+        },
+        "subscriberUrl": {
+            "type": "string",
+            "description": "New URL to receive webhook payloads",
+            "format": "uri"
+        },
+        "triggers": {
+            "type": "array",
+            "description": "Updated list of trigger events",
+            "items": {
+                "type": "string",
+                "enum": list(WEBHOOK_TRIGGERS)
+            }
+        },
+        "payloadTemplate": {
+            "type": "string",
+            "description": "Updated payload template (JSON string with Liquid variables)"
+        },
+        "secret": {
+            "type": "string",
+            "description": "New secret for verifying webhooks"
+        }
+    },
+    "required": ["webhook_id"]
+}
+
+#-------------------------------------------------------------------
+# Tool catalog, built once at import time and reused by every list_tools call
+_TOOLS: list[types.Tool] = [
+    # Get all schedules
+    types.Tool(
+        name="cal_get_all_schedules",
+        description="Retrieve all schedules from Cal.com API.",
+        inputSchema={
+            "type": "object",
+            "properties": {},  # No parameters required
+            "required": []
+        }
+    ),
+
+    # Create a schedule
+    types.Tool(
+        name="cal_create_a_schedule",
+        description="Create a new schedule in Cal.com.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Name of the new schedule"
+                },
+                "timeZone": {
+                    "type": "string",
+                    "description": "Time zone ID (e.g., 'America/New_York')"
+                },
+                "isDefault": {
+                    "type": "boolean",
+                    "description": "Whether this should be the default schedule"
+                },
+                "availability": {
+                    "type": "array",
+                    "description": "List of availability blocks",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "days": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Capitalized day names (e.g., ['Monday','Tuesday'])"
+                            },
+                            "startTime": {
+                                "type": "string",
+                                "description": "Start time in HH:mm format"
+                            },
+                            "endTime": {
+                                "type": "string",
+                                "description": "End time in HH:mm format"
+                            }
+                        }
+                    }
+                },
+                "overrides": {
+                    "type": "array",
+                    "description": "Date-specific overrides",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "date": {
+                                "type": "string",
+                                "description": "Date in YYYY-MM-DD format"
+                            },
+                            "startTime": {
+                                "type": "string",
+                                "description": "Start time in HH:mm format"
+                            },
+                            "endTime": {
+                                "type": "string",
+                                "description": "End time in HH:mm format"
+                            }
+                        }
+                    }
+                }
+            },
+            "required": ["name", "timeZone", "isDefault"]
+        }
+    ),
+
+    types.Tool(
+        name="cal_update_a_schedule",
+        description="Update an existing schedule in Cal.com.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "schedule_id": {
+                    "type": "integer",
+                    "description": "ID of the schedule to update"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Updated schedule name"
+                },
+                "timeZone": {
+                    "type": "string",
+                    "description": "Updated time zone ID (e.g., 'America/New_York')"
+                },
+                "isDefault": {
+                    "type": "boolean",
+                    "description": "Whether to make this the default schedule"
+                },
+                "availability": {
+                    "type": "array",
+                    "description": "Updated availability blocks",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "days": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Capitalized day names (e.g., ['Monday','Tuesday'])"
+                            },
+                            "startTime": {
+                                "type": "string",
+                                "description": "Start time in HH:mm format (e.g., '09:00')"
+                            },
+                            "endTime": {
+                                "type": "string",
+                                "description": "End time in HH:mm format (e.g., '17:00')"
+                            }
+                        }
+                    }
+                },
+                "overrides": {
+                    "type": "array",
+                    "description": "Updated date overrides",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "date": {
+                                "type": "string",
+                                "description": "Date in YYYY-MM-DD format (e.g., '2023-12-31')"
+                            },
+                            "startTime": {
+                                "type": "string",
+                                "description": "Start time in HH:mm format (e.g., '10:00')"
+                            },
+                            "endTime": {
+                                "type": "string",
+                                "description": "End time in HH:mm format (e.g., '15:00')"
+                            }
+                        }
+                    }
+                }
+            },
+            "required": ["schedule_id"]
+        }
+    ),
+
+    # Get default schedule
+    types.Tool(
+        name="cal_get_default_schedule",
+        description="Get the default schedule from Cal.com.",
+        inputSchema={
+            "type": "object",
+            "properties": {},  # No parameters
+            "required": []
+        }
+    ),
+
+    # Get specific schedule
+    types.Tool(
+        name="cal_get_schedule",
+        description="Get a specific schedule by its ID.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "schedule_id": {
+                    "type": "integer",
+                    "description": "ID of the schedule to retrieve"
+                }
+            },
+            "required": ["schedule_id"]
+        }
+    ),
+
+    # Get several schedules
+    types.Tool(
+        name="cal_get_schedules_by_ids",
+        description="Get several schedules from Cal.com by ID in one call. Results are in the same order as the IDs.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "schedule_ids": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "minItems": 1,
+                    "description": "IDs of the schedules to fetch"
+                }
+            },
+            "required": ["schedule_ids"]
+        }
+    ),
+
+    # Delete a schedule
+    types.Tool(
+        name="cal_delete_a_schedule",
+        description="Delete a schedule by its ID.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "schedule_id": {
+                    "type": "integer",
+                    "description": "ID of the schedule to delete"
+                }
+            },
+            "required": ["schedule_id"]
+        }
+    ),
+
+    # Stripe tools (tools/stripe.py) are not exposed: they could not be tested
+
+    #verified_resources.py---------------------------------------------------
+    # Email Verification Tools
+    types.Tool(
+        name="cal_request_email_verification_code",
+        description="Request an email verification code from Cal.com API.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "email": {
+                    "type": "string",
+                    "description": "Email address to verify",
+                    "format": "email"
+                }
+            },
+            "required": ["email"]
+        }
+    ),
+
+    types.Tool(
+        name="cal_verify_email_code",
+        description="Verify an email address with the received verification code.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "email": {
+                    "type": "string",
+                    "description": "Email address to verify",
+                    "format": "email"
+                },
+                "code": {
+                    "type": "string",
+                    "description": "Verification code received via email"
+                }
+            },
+            "required": ["email", "code"]
+        }
+    ),
+
+    types.Tool(
+        name="cal_get_verified_emails",
+        description="Retrieve all verified emails from Cal.com API.",
+        inputSchema={
+            "type": "object",
+            "properties": {},  # No parameters required
+            "required": []
+        }
+    ),
+
+    types.Tool(
+        name="cal_get_verified_email_by_id",
+        description="Get a specific verified email by its ID from Cal.com.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "email_id": {
+                    "type": "integer",
+                    "description": "ID of the verified email to retrieve"
+                }
+            },
+            "required": ["email_id"]
+        }
+    ),
+
+    types.Tool(
+        name="cal_get_verified_emails_by_ids",
+        description="Get several verified emails by ID from Cal.com in one call. Results are in the same order as the IDs.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "email_ids": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "minItems": 1,
+                    "description": "IDs of the verified emails to retrieve"
+                }
+            },
+            "required": ["email_ids"]
+        }
+    ),
+
+    # Phone Verification Tools (working functions only)
+    types.Tool(
+        name="cal_get_verified_phones",
+        description="Retrieve verified phone numbers with pagination support.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "take": {
+                    "type": "integer",
+                    "description": "Number of records to return (default: 250, max: 250)",
+                    "default": 250,
+                    "minimum": 1,
+                    "maximum": 250
+                },
+                "skip": {
+                    "type": "integer",
+                    "description": "Number of records to skip for pagination",
+                    "minimum": 0
+                }
+            },
+            "required": []
+        }
+    ),
+
+    types.Tool(
+        name="cal_get_all_verified_phones",
+        description="Retrieve all verified phone numbers, fetching the pages concurrently. Stops after 40 pages (or if paging stops returning new records) and sets truncated to true.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "take": {
+                    "type": "integer",
+                    "description": "Page size for each request (default: 250, max: 250)",
+                    "default": 250,
+                    "minimum": 1,
+                    "maximum": 250
+                }
+            },
+            "required": []
+        }
+    ),
+
+    types.Tool(
+        name="cal_get_verified_phone_by_id",
+        description="Get a specific verified phone number by its ID from Cal.com.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "phone_id": {
+                    "type": "integer",
+                    "description": "ID of the verified phone to retrieve"
+                }
+            },
+            "required": ["phone_id"]
+        }
+    ),
+
+    types.Tool(
+        name="cal_get_verified_phones_by_ids",
+        description="Get several verified phone numbers by ID from Cal.com in one call. Results are in the same order as the IDs.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "phone_ids": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "minItems": 1,
+                    "description": "IDs of the verified phones to retrieve"
+                }
+            },
+            "required": ["phone_ids"]
+        }
+    ),
+
+    # Webhook Tools-------------------------------------------------------------
+    types.Tool(
+        name="cal_get_all_webhooks",
+        description="Retrieve all webhooks with pagination support from Cal.com API.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "take": {
+                    "type": "integer",
+                    "description": "Number of records to return (default: 250)",
+                    "minimum": 1,
+                    "maximum": 250,
+                    "default": 250
+                },
+                "skip": {
+                    "type": "integer",
+                    "description": "Number of records to skip for pagination",
+                    "minimum": 0
+                }
+            },
+            "required": []
+        }
+    ),
+
+    types.Tool(
+        name="cal_create_webhook",
+        description="Create a new webhook in Cal.com.",
+        inputSchema=_CREATE_WEBHOOK_SCHEMA
+    ),
+
+    types.Tool(
+        name="cal_get_webhook",
+        description="Get a specific webhook by its ID from Cal.com.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "webhook_id": {
+                    "type": "string",
+                    "description": "ID of the webhook to retrieve"
+                }
+            },
+            "required": ["webhook_id"]
+        }
+    ),
+
+    types.Tool(
+        name="cal_update_webhook",
+        description="Update an existing webhook in Cal.com.",
+        inputSchema=_UPDATE_WEBHOOK_SCHEMA
+    ),
+
+    types.Tool(
+        name="cal_delete_webhook",
+        description="Delete a webhook by its ID from Cal.com.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "webhook_id": {
+                    "type": "string",
+                    "description": "ID of the webhook to delete"
+                }
+            },
+            "required": ["webhook_id"]
+        }
+    ),
+
+    types.Tool(
+        name="cal_get_webhooks_by_ids",
+        description="Get several webhooks by ID from Cal.com in one call. Results are in the same order as the IDs.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "webhook_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "minItems": 1,
+                    "description": "IDs of the webhooks to retrieve"
+                }
+            },
+            "required": ["webhook_ids"]
+        }
+    ),
+
+    types.Tool(
+        name="cal_create_webhooks",
+        description="Create several webhooks in Cal.com concurrently. Results are in the same order as the input.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "webhooks": {
+                    "type": "array",
+                    "items": {**_CREATE_WEBHOOK_SCHEMA, "additionalProperties": False},
+                    "minItems": 1,
+                    "description": "Webhooks to create, each with the arguments of cal_create_webhook"
+                }
+            },
+            "required": ["webhooks"]
+        }
+    ),
+
+    types.Tool(
+        name="cal_update_webhooks",
+        description="Update several webhooks in Cal.com concurrently. Results are in the same order as the input.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "webhooks": {
+                    "type": "array",
+                    "items": {**_UPDATE_WEBHOOK_SCHEMA, "additionalProperties": False},
+                    "minItems": 1,
+                    "description": "Webhook updates, each with the arguments of cal_update_webhook"
+                }
+            },
+            "required": ["webhooks"]
+        }
+    ),
+
+    types.Tool(
+        name="cal_delete_webhooks",
+        description="Delete several webhooks by ID from Cal.com concurrently. Results are in the same order as the IDs.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "webhook_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "minItems": 1,
+                    "description": "IDs of the webhooks to delete"
+                }
+            },
+            "required": ["webhook_ids"]
+        }
+    ),
+
+    # Batch
+    types.Tool(
+        name="cal_batch",
+        description="Run several independent Cal.com tools concurrently. Results come back in call order; a failed call gives {\"error\": ...} in its place.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calls": {
+                    "type": "array",
+                    "description": "Tool calls to run",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": "Name of the tool to call (e.g., cal_get_all_schedules)"
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Arguments for the tool"
+                            }
+                        },
+                        "required": ["name"]
+                    },
+                    "minItems": 1
+                }
+            },
+            "required": ["calls"]
+        }
+    )
+]
+
+# Mark each tool as read-only or not, so clients can tell safe lookups from
+# calls that change data on Cal.com
+_READ_ONLY = types.ToolAnnotations(readOnlyHint=True)
+_MUTATING = types.ToolAnnotations(readOnlyHint=False)
+for _tool in _TOOLS:
+    if _tool.name in READ_ONLY_TOOLS:
+        _tool.annotations = _READ_ONLY
+    elif _tool.name in MUTATING_TOOLS:
+        _tool.annotations = _MUTATING
+del _tool
+
+
+class _PreparedResult(types.ServerResult):
+    """
+    ServerResult for responses that never change between requests.
+
+    The session serializes every result with model_dump() before framing it,
+    so for a static result that walk is done once and the dict is reused.
+    """
+    _dumps: dict = PrivateAttr(default_factory=dict)
+
+    def model_dump(self, **kwargs) -> dict[str, Any]:
+        key = tuple(sorted(kwargs.items()))
+        dumped = self._dumps.get(key)
+        if dumped is None:
+            dumped = self._dumps[key] = super().model_dump(**kwargs)
+        return dumped
+
+
+_LIST_TOOLS_RESULT = _PreparedResult(types.ListToolsResult(tools=_TOOLS))
+# Dump it at import with the arguments the session uses when framing a
+# response, so the first tools/list request is served from the cache too
+_LIST_TOOLS_RESULT.model_dump(by_alias=True, mode="json", exclude_none=True)
+
+
+# Tools this server serves: the ones listed in the catalog above
+_TOOL_NAMES: frozenset[str] = frozenset(sys.intern(tool.name) for tool in _TOOLS)
+
+# One compiled validator per tool. The server's built-in input validation
+# re-checks the schema and builds a new validator on every call.
+_VALIDATORS: dict[str, Draft202012Validator] = {
+    tool.name: Draft202012Validator(tool.inputSchema) for tool in _TOOLS
+}
+
+def _required_getter(names: tuple[str, ...]) -> Callable[[dict], tuple]:
+    # itemgetter fetches every required argument in one C-level call; it
+    # returns a bare value rather than a tuple when given a single key
+    if not names:
+        return lambda arguments: ()
+    getter = itemgetter(*names)
+    if len(names) == 1:
+        return lambda arguments: (getter(arguments),)
+    return getter
+
+
+# Tool name -> (required names, getter for them, optional names), from its
+# inputSchema. Handler keyword arguments match these names; any other keys
+# are not passed on.
+_TOOL_ARGS: dict[str, tuple[tuple[str, ...], Callable[[dict], tuple], tuple[str, ...]]] = {}
+for _tool in _TOOLS:
+    _required = tuple(_tool.inputSchema["required"])
+    _optional = tuple(k for k in _tool.inputSchema["properties"] if k not in _required)
+    _TOOL_ARGS[_tool.name] = (_required, _required_getter(_required), _optional)
+del _tool, _required, _optional
+
+# Tool name -> handler, filled in on the first call of each tool so the tool
+# modules are only imported when used
+_DISPATCH: dict[str, Callable[..., Awaitable[dict]]] = {}
+
+
+def _get_handler(name: str) -> Callable[..., Awaitable[dict]] | None:
+    handler = _DISPATCH.get(name)
+    if handler is None and name in _TOOL_NAMES:
+        handler = _DISPATCH[name] = getattr(tools, name)
+    return handler
+
+
+def _prepare_call(name: str, arguments: dict) -> tuple[Callable[..., Awaitable[Any]], dict]:
+    """Resolve a tool and validate its arguments; returns (handler, kwargs)."""
+    handler = _get_handler(name)
+    if handler is None:
+        raise ValueError(f"Unknown tool: {name}")
+
+    error = best_match(_VALIDATORS[name].iter_errors(arguments))
+    if error is not None:
+        raise ValueError(f"Input validation error: {error.message}")
+
+    required, get_required, optional = _TOOL_ARGS[name]
+    kwargs = dict(zip(required, get_required(arguments)))
+    kwargs.update((k, arguments[k]) for k in optional if k in arguments)
+    return handler, kwargs
+
+
+async def _run_batched(call: dict) -> Any:
+    name = sys.intern(call["name"])
+    if name == "cal_batch":
+        raise ValueError("cal_batch calls cannot be nested")
+    handler, kwargs = _prepare_call(name, call.get("arguments") or {})
+    return await handler(**kwargs)
+
+
+async def cal_batch(calls: List[dict]) -> List[Any]:
+    """
+    Run independent tool calls concurrently, so N reads take about as long
+    as the slowest one instead of the sum of all of them.
+    """
+    results = await asyncio.gather(*map(_run_batched, calls), return_exceptions=True)
+    for call, result in zip(calls, results):
+        if isinstance(result, Exception):
+            logger.error("Error in batched %s: %s", call["name"], result)
+    return [
+        {"error": str(result)} if isinstance(result, Exception) else result
+        for result in results
+    ]
+
+
+_DISPATCH["cal_batch"] = cal_batch
+
+
+# Returned by handle_sse once the stream closes. Response only reads its
+# status, headers and body when sent, so one instance serves every session.
+_EMPTY_RESPONSE = Response()
+
+
+def _ok(result: Any) -> list[types.TextContent]:
+    # Compact output: the text is read by a model, not a person
+    return [types.TextContent(type="text", text=orjson.dumps(result).decode())]
+
+
+def _err(e: Exception) -> list[types.TextContent]:
+    return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+
+
+
 @click.command()
 @click.option("--port", default=CAL_COM_MCP_SERVER_PORT, help="Port to listen on for HTTP")
 @click.option(
@@ -92,938 +809,33 @@ def main(
     # Create the MCP server instance
     app = Server("cal-com-mcp-server")
 #-------------------------------------------------------------------
-    @app.list_tools()
-    async def list_tools() -> list[types.Tool]:
-        return [
-            # Get all schedules
-            types.Tool(
-                name="cal_get_all_schedules",
-                description="Retrieve all schedules from Cal.com API.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},  # No parameters required
-                    "required": []
-                }
-            ),
-
-            # Create a schedule
-            types.Tool(
-                name="cal_create_a_schedule",
-                description="Create a new schedule in Cal.com.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "description": "Name of the new schedule"
-                        },
-                        "timeZone": {
-                            "type": "string",
-                            "description": "Time zone ID (e.g., 'America/New_York')"
-                        },
-                        "isDefault": {
-                            "type": "boolean",
-                            "description": "Whether this should be the default schedule"
-                        },
-                        "availability": {
-                            "type": "array",
-                            "description": "List of availability blocks",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "days": {
-                                        "type": "array",
-                                        "items": {"type": "string"},
-                                        "description": "Capitalized day names (e.g., ['Monday','Tuesday'])"
-                                    },
-                                    "startTime": {
-                                        "type": "string",
-                                        "description": "Start time in HH:mm format"
-                                    },
-                                    "endTime": {
-                                        "type": "string",
-                                        "description": "End time in HH:mm format"
-                                    }
-                                }
-                            }
-                        },
-                        "overrides": {
-                            "type": "array",
-                            "description": "Date-specific overrides",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "date": {
-                                        "type": "string",
-                                        "description": "Date in YYYY-MM-DD format"
-                                    },
-                                    "startTime": {
-                                        "type": "string",
-                                        "description": "Start time in HH:mm format"
-                                    },
-                                    "endTime": {
-                                        "type": "string",
-                                        "description": "End time in HH:mm format"
-                                    }
-                                }
-                            }
-                        }
-                    },
-                    "required": ["name", "timeZone", "isDefault"]
-                }
-            ),
-
-            types.Tool(
-                name="cal_update_a_schedule",
-                description="Update an existing schedule in Cal.com.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "schedule_id": {
-                            "type": "integer",
-                            "description": "ID of the schedule to update"
-                        },
-                        "name": {
-                            "type": "string",
-                            "description": "Updated schedule name"
-                        },
-                        "timeZone": {
-                            "type": "string",
-                            "description": "Updated time zone ID (e.g., 'America/New_York')"
-                        },
-                        "isDefault": {
-                            "type": "boolean",
-                            "description": "Whether to make this the default schedule"
-                        },
-                        "availability": {
-                            "type": "array",
-                            "description": "Updated availability blocks",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "days": {
-                                        "type": "array",
-                                        "items": {"type": "string"},
-                                        "description": "Capitalized day names (e.g., ['Monday','Tuesday'])"
-                                    },
-                                    "startTime": {
-                                        "type": "string",
-                                        "description": "Start time in HH:mm format (e.g., '09:00')"
-                                    },
-                                    "endTime": {
-                                        "type": "string",
-                                        "description": "End time in HH:mm format (e.g., '17:00')"
-                                    }
-                                }
-                            }
-                        },
-                        "overrides": {
-                            "type": "array",
-                            "description": "Updated date overrides",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "date": {
-                                        "type": "string",
-                                        "description": "Date in YYYY-MM-DD format (e.g., '2023-12-31')"
-                                    },
-                                    "startTime": {
-                                        "type": "string",
-                                        "description": "Start time in HH:mm format (e.g., '10:00')"
-                                    },
-                                    "endTime": {
-                                        "type": "string",
-                                        "description": "End time in HH:mm format (e.g., '15:00')"
-                                    }
-                                }
-                            }
-                        }
-                    },
-                    "required": ["schedule_id"]
-                }
-            ),
-
-            # Get default schedule
-            types.Tool(
-                name="cal_get_default_schedule",
-                description="Get the default schedule from Cal.com.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},  # No parameters
-                    "required": []
-                }
-            ),
-
-            # Get specific schedule
-            types.Tool(
-                name="cal_get_schedule",
-                description="Get a specific schedule by its ID.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "schedule_id": {
-                            "type": "integer",
-                            "description": "ID of the schedule to retrieve"
-                        }
-                    },
-                    "required": ["schedule_id"]
-                }
-            ),
-
-            # Delete a schedule
-            types.Tool(
-                name="cal_delete_a_schedule",
-                description="Delete a schedule by its ID.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "schedule_id": {
-                            "type": "integer",
-                            "description": "ID of the schedule to delete"
-                        }
-                    },
-                    "required": ["schedule_id"]
-                }
-            ),
-
-            #Stripe.py----------------------------------------------------------------
-
-
-            #types.Tool(
-            #    name="cal_get_stripe_connect_url",
-            #    description="Retrieve Stripe Connect URL from Cal.com API for payment setup",
-            #    inputSchema={
-            #        "type": "object",
-            #        "properties": {},  # No parameters required
-            #        "required": []
-            #    }
-            #),
-            #types.Tool(
-            #    name="cal_save_stripe_credentials",
-            #    description="Save Stripe credentials in Cal.com after OAuth authorization",
-            #    inputSchema={
-            #        "type": "object",
-            #        "properties": {
-            #            "state": {
-            #                "type": "string",
-            #                "description": "OAuth state parameter for security verification"
-            #            },
-            #            "code": {
-            #                "type": "string",
-            #                "description": "OAuth authorization code from Stripe"
-            #            }
-            #        },
-            #        "required": ["state", "code"]  # Both parameters are required
-            #    }
-            #),
-            #types.Tool(
-            #    name="cal_check_stripe_connection",
-            #    description="Check Stripe connection status in Cal.com",
-            #    inputSchema={
-            #        "type": "object",
-            #        "properties": {},  # No parameters required
-            #        "required": []
-            #    }
-            #),
-
-
-
-            #verified_resources.py---------------------------------------------------
-            # Email Verification Tools
-            types.Tool(
-                name="cal_request_email_verification_code",
-                description="Request an email verification code from Cal.com API.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "email": {
-                            "type": "string",
-                            "description": "Email address to verify",
-                            "format": "email"
-                        }
-                    },
-                    "required": ["email"]
-                }
-            ),
-
-            types.Tool(
-                name="cal_verify_email_code",
-                description="Verify an email address with the received verification code.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "email": {
-                            "type": "string",
-                            "description": "Email address to verify",
-                            "format": "email"
-                        },
-                        "code": {
-                            "type": "string",
-                            "description": "Verification code received via email"
-                        }
-                    },
-                    "required": ["email", "code"]
-                }
-            ),
-
-            types.Tool(
-                name="cal_get_verified_emails",
-                description="Retrieve all verified emails from Cal.com API.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},  # No parameters required
-                    "required": []
-                }
-            ),
-
-            types.Tool(
-                name="cal_get_verified_email_by_id",
-                description="Get a specific verified email by its ID from Cal.com.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "email_id": {
-                            "type": "integer",
-                            "description": "ID of the verified email to retrieve"
-                        }
-                    },
-                    "required": ["email_id"]
-                }
-            ),
-
-            # Phone Verification Tools (working functions only)
-            types.Tool(
-                name="cal_get_verified_phones",
-                description="Retrieve verified phone numbers with pagination support.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "take": {
-                            "type": "integer",
-                            "description": "Number of records to return (default: 250, max: 250)",
-                            "default": 250,
-                            "minimum": 1,
-                            "maximum": 250
-                        },
-                        "skip": {
-                            "type": "integer",
-                            "description": "Number of records to skip for pagination",
-                            "minimum": 0
-                        }
-                    },
-                    "required": []
-                }
-            ),
-
-            types.Tool(
-                name="cal_get_verified_phone_by_id",
-                description="Get a specific verified phone number by its ID from Cal.com.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "phone_id": {
-                            "type": "integer",
-                            "description": "ID of the verified phone to retrieve"
-                        }
-                    },
-                    "required": ["phone_id"]
-                }
-            ),
-
-            # Webhook Tools-------------------------------------------------------------
-            types.Tool(
-                name="cal_get_all_webhooks",
-                description="Retrieve all webhooks with pagination support from Cal.com API.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "take": {
-                            "type": "integer",
-                            "description": "Number of records to return (default: 250)",
-                            "minimum": 1,
-                            "maximum": 250,
-                            "default": 250
-                        },
-                        "skip": {
-                            "type": "integer",
-                            "description": "Number of records to skip for pagination",
-                            "minimum": 0
-                        }
-                    },
-                    "required": []
-                }
-            ),
-
-            types.Tool(
-                name="cal_create_webhook",
-                description="Create a new webhook in Cal.com.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "active": {
-                            "type": "boolean",
-                            "description": "Whether the webhook is active"
-                        },
-                        "subscriberUrl": {
-                            "type": "string",
-                            "description": "URL to receive webhook payloads",
-                            "format": "uri"
-                        },
-                        "triggers": {
-                            "type": "array",
-                            "description": "List of trigger events",
-                            "items": {
-                                "type": "string",
-                                "enum": [
-                                    "BOOKING_CREATED",
-                                    "BOOKING_PAYMENT_INITIATED",
-                                    "BOOKING_PAID",
-                                    "BOOKING_RESCHEDULED",
-                                    "BOOKING_REQUESTED",
-                                    "BOOKING_CANCELLED",
-                                    "BOOKING_REJECTED",
-                                    "BOOKING_NO_SHOW_UPDATED",
-                                    "FORM_SUBMITTED",
-                                    "MEETING_ENDED",
-                                    "MEETING_STARTED",
-                                    "RECORDING_READY",
-                                    "INSTANT_MEETING",
-                                    "RECORDING_TRANSCRIPTION_GENERATED",
-                                    "OOO_CREATED",
-                                    "AFTER_HOSTS_CAL_VIDEO_NO_SHOW",
-                                    "AFTER_GUESTS_CAL_VIDEO_NO_SHOW",
-                                    "FORM_SUBMITTED_NO_EVENT"
-                                ]
-                            }
-                        },
-                        "payloadTemplate": {
-                            "type": "string",
-                            "description": "Custom payload template (JSON string with Liquid variables)"
-                        },
-                        "secret": {
-                            "type": "string",
-                            "description": "Secret for verifying webhooks"
-                        }
-                    },
-                    "required": ["active", "subscriberUrl", "triggers"]
-                }
-            ),
-
-            types.Tool(
-                name="cal_get_webhook",
-                description="Get a specific webhook by its ID from Cal.com.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "webhook_id": {
-                            "type": "string",
-                            "description": "ID of the webhook to retrieve"
-                        }
-                    },
-                    "required": ["webhook_id"]
-                }
-            ),
-
-            types.Tool(
-                name="cal_update_webhook",
-                description="Update an existing webhook in Cal.com.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "webhook_id": {
-                            "type": "string",
-                            "description": "ID of the webhook to update"
-                        },
-                        "active": {
-                            "type": "boolean",
-                            "description": "Whether the webhook is active"
-                        },
-                        "subscriberUrl": {
-                            "type": "string",
-                            "description": "New URL to receive webhook payloads",
-                            "format": "uri"
-                        },
-                        "triggers": {
-                            "type": "array",
-                            "description": "Updated list of trigger events",
-                            "items": {
-                                "type": "string",
-                                "enum": [
-                                    "BOOKING_CREATED",
-                                    "BOOKING_PAYMENT_INITIATED",
-                                    "BOOKING_PAID",
-                                    "BOOKING_RESCHEDULED",
-                                    "BOOKING_REQUESTED",
-                                    "BOOKING_CANCELLED",
-                                    "BOOKING_REJECTED",
-                                    "BOOKING_NO_SHOW_UPDATED",
-                                    "FORM_SUBMITTED",
-                                    "MEETING_ENDED",
-                                    "MEETING_STARTED",
-                                    "RECORDING_READY",
-                                    "INSTANT_MEETING",
-                                    "RECORDING_TRANSCRIPTION_GENERATED",
-                                    "OOO_CREATED",
-                                    "AFTER_HOSTS_CAL_VIDEO_NO_SHOW",
-                                    "AFTER_GUESTS_CAL_VIDEO_NO_SHOW",
-                                    "FORM_SUBMITTED_NO_EVENT"
-                                ]
-                            }
-                        },
-                        "payloadTemplate": {
-                            "type": "string",
-                            "description": "Updated payload template (JSON string with Liquid variables)"
-                        },
-                        "secret": {
-                            "type": "string",
-                            "description": "New secret for verifying webhooks"
-                        }
-                    },
-                    "required": ["webhook_id"]
-                }
-            ),
-
-            types.Tool(
-                name="cal_delete_webhook",
-                description="Delete a webhook by its ID from Cal.com.",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "webhook_id": {
-                            "type": "string",
-                            "description": "ID of the webhook to delete"
-                        }
-                    },
-                    "required": ["webhook_id"]
-                }
-            )
+    # Serve the prepared catalog directly instead of going through
+    # @app.list_tools(), which rebuilds the result on every request. That
+    # decorator also fills the server's tool cache, so prime it here.
+    app._tool_cache.update((tool.name, tool) for tool in _TOOLS)
 
+    async def list_tools(_: Any) -> types.ServerResult:
+        return _LIST_TOOLS_RESULT
 
-        ]
+    app.request_handlers[types.ListToolsRequest] = list_tools
 
-    @app.call_tool()
+    @app.call_tool(validate_input=False)
     async def call_tool(
             name: str,
             arguments: dict
     ) -> List[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+        # Names arrive freshly decoded from JSON; interning them lets the
+        # lookup match _DISPATCH keys by identity
+        name = sys.intern(name)
+        handler, kwargs = _prepare_call(name, arguments)
+
+        try:
+            result = await handler(**kwargs)
+            return _ok(result)
+        except Exception as e:
+            logger.exception("Error in %s: %s", name, e)
+            return _err(e)
 
-        #Schedule.py------------------------------------------------------------------
-        if name == "cal_get_all_schedules":
-            try:
-                result = cal_get_all_schedules()
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error getting all schedules: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-
-        elif name == "cal_create_a_schedule":
-            try:
-                result = cal_create_a_schedule(
-                    name=arguments["name"],
-                    timeZone=arguments["timeZone"],
-                    isDefault=arguments["isDefault"],
-                    availability=arguments.get("availability"),
-                    overrides=arguments.get("overrides")
-                )
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error creating schedule: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-
-        elif name == "cal_update_a_schedule":
-            try:
-                result = cal_update_a_schedule(
-                    schedule_id=arguments["schedule_id"],
-                    name=arguments.get("name"),
-                    timeZone=arguments.get("timeZone"),
-                    isDefault=arguments.get("isDefault"),
-                    availability=arguments.get("availability"),
-                    overrides=arguments.get("overrides")
-                )
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error updating schedule: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-
-        elif name == "cal_get_default_schedule":
-            try:
-                result = cal_get_default_schedule()
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error getting default schedule: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-
-        elif name == "cal_get_schedule":
-            try:
-                result = cal_get_schedule(
-                    schedule_id=arguments["schedule_id"]
-                )
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error getting schedule: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-
-        elif name == "cal_delete_a_schedule":
-            try:
-                result = cal_delete_a_schedule(
-                    schedule_id=arguments["schedule_id"]
-                )
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error deleting schedule: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-
-        #verified_resources.py-----------------------------------------------------------
-        elif name == "cal_request_email_verification_code":
-            try:
-                result = cal_request_email_verification_code(
-                    email=arguments["email"]
-                )
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error requesting email verification code: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-
-        elif name == "cal_verify_email_code":
-            try:
-                result = cal_verify_email_code(
-                    email=arguments["email"],
-                    code=arguments["code"]
-                )
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error verifying email code: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-
-        elif name == "cal_get_verified_emails":
-            try:
-                result = cal_get_verified_emails()
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error getting verified emails: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-
-        elif name == "cal_get_verified_email_by_id":
-            try:
-                result = cal_get_verified_email_by_id(
-                    email_id=arguments["email_id"]
-                )
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error getting verified email by ID: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-
-        elif name == "cal_get_verified_phones":
-            try:
-                result = cal_get_verified_phones(
-                    take=arguments.get("take"),
-                    skip=arguments.get("skip")
-                )
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error getting verified phones: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-
-        elif name == "cal_get_verified_phone_by_id":
-            try:
-                result = cal_get_verified_phone_by_id(
-                    phone_id=arguments["phone_id"]
-                )
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error getting verified phone by ID: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-
-        #webhooks.py-----------------------------------------------------------------------
-        elif name == "cal_get_all_webhooks":
-            try:
-                result = cal_get_all_webhooks(
-                    take=arguments.get("take"),
-                    skip=arguments.get("skip")
-                )
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error getting all webhooks: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-
-        elif name == "cal_create_webhook":
-            try:
-                result = cal_create_webhook(
-                    active=arguments["active"],
-                    subscriberUrl=arguments["subscriberUrl"],
-                    triggers=arguments["triggers"],
-                    payloadTemplate=arguments.get("payloadTemplate"),
-                    secret=arguments.get("secret")
-                )
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error creating webhook: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-
-        elif name == "cal_get_webhook":
-            try:
-                result = cal_get_webhook(
-                    webhook_id=arguments["webhook_id"]
-                )
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error getting webhook: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-
-        elif name == "cal_update_webhook":
-            try:
-                result = cal_update_webhook(
-                    webhook_id=arguments["webhook_id"],
-                    active=arguments.get("active"),
-                    subscriberUrl=arguments.get("subscriberUrl"),
-                    triggers=arguments.get("triggers"),
-                    payloadTemplate=arguments.get("payloadTemplate"),
-                    secret=arguments.get("secret")
-                )
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error updating webhook: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-
-        elif name == "cal_delete_webhook":
-            try:
-                result = cal_delete_webhook(
-                    webhook_id=arguments["webhook_id"]
-                )
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error deleting webhook: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-
-
-        #Stripe.py-------------------------------------------------------------------------
-        '''
-        elif name == "cal_get_stripe_connect_url":
-            try:
-                result = cal_get_stripe_connect_url()
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error getting Stripe URL: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-        elif name == "cal_save_stripe_credentials":
-            try:
-                result = cal_save_stripe_credentials(
-                    state=arguments["state"],
-                    code=arguments["code"]
-                )
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error saving credentials: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-
-        elif name == "cal_check_stripe_connection":
-            try:
-                result = cal_check_stripe_connection()
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=json.dumps(result, indent=2),
-                    )
-                ]
-            except Exception as e:
-                logger.exception(f"Error checking connection: {e}")
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}",
-                    )
-                ]
-        '''
     #-------------------------------------------------------------------------
 
     # Set up SSE transport
@@ -1047,7 +859,7 @@ def main(
         finally:
             auth_token_context.reset(token)
 
-        return Response()
+        return _EMPTY_RESPONSE
 
     # Set up StreamableHTTP transport
     session_manager = StreamableHTTPSessionManager(
@@ -1063,8 +875,12 @@ def main(
         logger.info("Handling StreamableHTTP request")
 
         # Extract auth token from headers (allow None - will be handled at tool level)
-        headers = dict(scope.get("headers", []))
-        auth_token = headers.get(b'x-auth-token')
+        # Scan the raw header list for the one header needed instead of
+        # building a dict of all of them
+        auth_token = next(
+            (value for key, value in scope.get("headers", ()) if key == b'x-auth-token'),
+            None,
+        )
         if auth_token:
             auth_token = auth_token.decode('utf-8')
 
@@ -1080,10 +896,17 @@ def main(
         """Context manager for session manager."""
         async with session_manager.run():
             logger.info("Application started with dual transports!")
+            # Warm the Cal.com connection in the background; startup does
+            # not wait on it
+            warmup = asyncio.create_task(warm_http_client())
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                warmup.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await warmup
+                await close_http_client()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
@@ -1096,16 +919,29 @@ def main(
             # StreamableHTTP route
             Mount("/mcp", app=handle_streamable_http),
         ],
+        # Compresses plain JSON responses (StreamableHTTP with --json-response).
+        # Starlette skips text/event-stream, so SSE streams are not buffered.
+        middleware=[Middleware(GZipMiddleware, minimum_size=512)],
         lifespan=lifespan,
     )
 
-    logger.info(f"Server starting on port {port} with dual transports:")
-    logger.info(f"  - SSE endpoint: http://localhost:{port}/sse")
-    logger.info(f"  - StreamableHTTP endpoint: http://localhost:{port}/mcp")
+    logger.info("Server starting on port %s with dual transports:", port)
+    logger.info("  - SSE endpoint: http://localhost:%s/sse", port)
+    logger.info("  - StreamableHTTP endpoint: http://localhost:%s/mcp", port)
 
     import uvicorn
 
-    uvicorn.run(starlette_app, host="0.0.0.0", port=port)
+    # "auto" picks uvloop and httptools when installed (see requirements.txt)
+    # and falls back to asyncio/h11 otherwise. Idle connections are kept
+    # open longer than uvicorn's 5s default so clients can reuse them.
+    uvicorn.run(
+        starlette_app,
+        host="0.0.0.0",
+        port=port,
+        loop="auto",
+        http="auto",
+        timeout_keep_alive=75,
+    )
 
     return 0
 
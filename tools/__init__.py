@@ -1,47 +1,97 @@
+import importlib
+
 from .base import (
-    auth_token_context
+    WEBHOOK_TRIGGERS,
+    auth_token_context,
+    close_http_client,
+    warm_http_client
 )
 
-from .schedule import (
-    cal_get_all_schedules,
-    cal_create_a_schedule,
-    cal_update_a_schedule,
-    cal_get_default_schedule,
-    cal_get_schedule,
-    cal_delete_a_schedule
-)
+# Tool functions are loaded on first access (PEP 562 module __getattr__),
+# so only the submodules a session actually uses get imported.
+_LAZY_ATTRS = {
+    # schedule.py
+    "cal_get_all_schedules": ".schedule",
+    "cal_create_a_schedule": ".schedule",
+    "cal_update_a_schedule": ".schedule",
+    "cal_get_default_schedule": ".schedule",
+    "cal_get_schedule": ".schedule",
+    "cal_get_schedules_by_ids": ".schedule",
+    "cal_delete_a_schedule": ".schedule",
 
-from .stripe import (
-    cal_get_stripe_connect_url,
-    cal_save_stripe_credentials,
-    cal_check_stripe_connection
-)
+    # stripe.py
+    "cal_get_stripe_connect_url": ".stripe",
+    "cal_save_stripe_credentials": ".stripe",
+    "cal_check_stripe_connection": ".stripe",
 
-from .verified_resources import (
-    cal_request_email_verification_code,
-    cal_verify_email_code,
-    cal_get_verified_emails,
-    cal_get_verified_email_by_id,
+    # verified_resources.py
+    "cal_request_email_verification_code": ".verified_resources",
+    "cal_verify_email_code": ".verified_resources",
+    "cal_get_verified_emails": ".verified_resources",
+    "cal_get_verified_email_by_id": ".verified_resources",
+    "cal_get_verified_emails_by_ids": ".verified_resources",
 
     # Not added functions that were not working on my side, but in the code -
     # cal_request_phone_verification_code,
     # cal_verify_phone_code,
 
-    cal_get_verified_phones,
-    cal_get_verified_phone_by_id
-)
+    "cal_get_verified_phones": ".verified_resources",
+    "cal_get_all_verified_phones": ".verified_resources",
+    "cal_get_verified_phone_by_id": ".verified_resources",
+    "cal_get_verified_phones_by_ids": ".verified_resources",
+
+    # webhooks.py
+    "cal_get_all_webhooks": ".webhooks",
+    "cal_create_webhook": ".webhooks",
+    "cal_get_webhook": ".webhooks",
+    "cal_update_webhook": ".webhooks",
+    "cal_delete_webhook": ".webhooks",
+    "cal_get_webhooks_by_ids": ".webhooks",
+    "cal_create_webhooks": ".webhooks",
+    "cal_update_webhooks": ".webhooks",
+    "cal_delete_webhooks": ".webhooks",
+}
+
+# Tool classification, for callers that treat reads and writes differently
+READ_ONLY_TOOLS = frozenset({
+    "cal_get_all_schedules",
+    "cal_get_default_schedule",
+    "cal_get_schedule",
+    "cal_get_schedules_by_ids",
+    "cal_get_stripe_connect_url",
+    "cal_check_stripe_connection",
+    "cal_get_verified_emails",
+    "cal_get_verified_email_by_id",
+    "cal_get_verified_emails_by_ids",
+    "cal_get_verified_phones",
+    "cal_get_all_verified_phones",
+    "cal_get_verified_phone_by_id",
+    "cal_get_verified_phones_by_ids",
+    "cal_get_all_webhooks",
+    "cal_get_webhook",
+    "cal_get_webhooks_by_ids",
+})
+
+MUTATING_TOOLS = frozenset(_LAZY_ATTRS.keys() - READ_ONLY_TOOLS)
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-from .webhooks import (
-    cal_get_all_webhooks,
-    cal_create_webhook,
-    cal_get_webhook,
-    cal_update_webhook,
-    cal_delete_webhook
-)
 
 __all__ = [
     # base.py
     "auth_token_context",
+    "close_http_client",
+    "warm_http_client",
+    "READ_ONLY_TOOLS",
+    "MUTATING_TOOLS",
+    "WEBHOOK_TRIGGERS",
 
     # schedule.py
     "cal_get_all_schedules",
@@ -49,6 +99,7 @@ __all__ = [
     "cal_update_a_schedule",
     "cal_get_default_schedule",
     "cal_get_schedule",
+    "cal_get_schedules_by_ids",
     "cal_delete_a_schedule",
 
     # stripe.py
@@ -61,13 +112,20 @@ __all__ = [
     "cal_verify_email_code",
     "cal_get_verified_emails",
     "cal_get_verified_email_by_id",
+    "cal_get_verified_emails_by_ids",
     "cal_get_verified_phones",
+    "cal_get_all_verified_phones",
     "cal_get_verified_phone_by_id",
+    "cal_get_verified_phones_by_ids",
 
     # webhooks.py
     "cal_get_all_webhooks",
     "cal_create_webhook",
     "cal_get_webhook",
     "cal_update_webhook",
-    "cal_delete_webhook"
-]
\ No newline at end of file
+    "cal_delete_webhook",
+    "cal_get_webhooks_by_ids",
+    "cal_create_webhooks",
+    "cal_update_webhooks",
+    "cal_delete_webhooks"
+]
@@ -1,16 +1,134 @@
+import asyncio
+import functools
+import inspect
 import logging
 import os
+import time
+from collections import OrderedDict
 from contextvars import ContextVar
-from typing import Optional
-from dotenv import load_dotenv
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Iterable, Mapping, NamedTuple, Optional
 
-# Load environment variables from .env file
-load_dotenv()
+import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
 auth_token_context: ContextVar[str] = ContextVar('auth_token')
 
+# One pooled client for every Cal.com call, so connections (and their TLS
+# handshakes) are reused across tool calls instead of opened per request.
+_http_client: Optional[httpx.AsyncClient] = None
+
+class _CachedResponse(NamedTuple):
+    expires: float
+    response: httpx.Response
+
+# Successful GET responses are kept briefly so repeated reads of the same
+# resource skip the round trip. The auth token is part of the key, so
+# sessions with different tokens never share entries.
+_CACHE_TTL = float(os.getenv("CAL_COM_CACHE_TTL", "30"))
+_CACHE_MAXSIZE = 256
+_response_cache: "OrderedDict[tuple, _CachedResponse]" = OrderedDict()
+
+# Trigger events accepted by Cal.com webhooks, shared by the server's tool
+# schemas and the webhook tools; kept here so neither loads the other
+WEBHOOK_TRIGGERS: tuple[str, ...] = (
+    "BOOKING_CREATED",
+    "BOOKING_PAYMENT_INITIATED",
+    "BOOKING_PAID",
+    "BOOKING_RESCHEDULED",
+    "BOOKING_REQUESTED",
+    "BOOKING_CANCELLED",
+    "BOOKING_REJECTED",
+    "BOOKING_NO_SHOW_UPDATED",
+    "FORM_SUBMITTED",
+    "MEETING_ENDED",
+    "MEETING_STARTED",
+    "RECORDING_READY",
+    "INSTANT_MEETING",
+    "RECORDING_TRANSCRIPTION_GENERATED",
+    "OOO_CREATED",
+    "AFTER_HOSTS_CAL_VIDEO_NO_SHOW",
+    "AFTER_GUESTS_CAL_VIDEO_NO_SHOW",
+    "FORM_SUBMITTED_NO_EVENT",
+)
+
+# Outgoing requests are paced to stay under Cal.com's rate limit (per
+# minute per API key, default 120) instead of bursting into 429s. Short
+# bursts are allowed; a 429 that still gets through is retried after
+# Retry-After. Values below 1 are clamped, since a rate of 0 never refills.
+_RATE_LIMIT = max(float(os.getenv("CAL_COM_RATE_LIMIT", "120")), 1.0)
+_RATE_BURST = 20
+_RATE_LIMITERS_MAXSIZE = 256
+_MAX_RATE_LIMIT_RETRIES = 3
+
+class _RateLimiter:
+    """
+    Token bucket shared by all requests made with one API key: holds up to
+    `burst` tokens and refills at `rate` tokens per second; each request
+    takes one.
+    """
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        # The lock makes waiters take tokens in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+# One bucket per Authorization header, so a busy tenant only waits on its
+# own budget. Least recently used buckets are dropped beyond the maxsize.
+_rate_limiters: "OrderedDict[Optional[str], _RateLimiter]" = OrderedDict()
+
+def _rate_limiter_for(token: Optional[str]) -> _RateLimiter:
+    limiter = _rate_limiters.get(token)
+    if limiter is None:
+        limiter = _rate_limiters[token] = _RateLimiter(_RATE_LIMIT / 60, _RATE_BURST)
+        while len(_rate_limiters) > _RATE_LIMITERS_MAXSIZE:
+            _rate_limiters.popitem(last=False)
+    else:
+        _rate_limiters.move_to_end(token)
+    return limiter
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    # Retry-After is in seconds for Cal.com; otherwise back off 1s, 2s, 4s
+    try:
+        return min(float(response.headers["Retry-After"]), 30.0)
+    except (KeyError, ValueError):
+        return float(2 ** attempt)
+
+class _RateLimitedTransport(httpx.AsyncHTTPTransport):
+    """
+    Transport that paces requests through their API key's rate limiter and
+    retries ones rejected with 429. A 429 means the request was not
+    processed, so this is safe for writes too.
+    """
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        limiter = _rate_limiter_for(request.headers.get("Authorization"))
+        attempt = 0
+        while True:
+            await limiter.acquire()
+            response = await super().handle_async_request(request)
+            if response.status_code != 429 or attempt == _MAX_RATE_LIMIT_RETRIES:
+                return response
+            delay = _retry_delay(response, attempt)
+            await response.aclose()
+            logger.warning("Cal.com rate limit hit, retrying %s in %.1fs", request.url, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
 def get_auth_token() -> str:
     try:
         token = auth_token_context.get()
@@ -30,5 +148,239 @@ def get_calcom_client() -> Optional[dict]:
         client = auth_token
         return client
     except RuntimeError as e:
-        logger.warning(f"Failed to get auth token: {e}")
-        return None
\ No newline at end of file
+        logger.warning("Failed to get auth token: %s", e)
+        return None
+
+@functools.lru_cache(maxsize=256)
+def build_headers(
+    token: str,
+    *,
+    api_version: Optional[str] = None,
+    json_body: bool = False,
+) -> MappingProxyType:
+    """
+    Return Cal.com request headers for token, plus cal-api-version and/or a
+    JSON Content-Type when asked for.
+
+    Built once per combination; read-only because the same mapping is shared
+    by every call.
+    """
+    headers = {"Authorization": token}
+    if api_version is not None:
+        headers["cal-api-version"] = api_version
+    if json_body:
+        headers["Content-Type"] = "application/json"
+    return MappingProxyType(headers)
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared AsyncClient used for Cal.com API calls, creating it on first use.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            # Fail fast on connect (retried below), allow slower reads
+            timeout=httpx.Timeout(10.0, connect=3.0),
+            # retries= re-attempts failed connects (DNS, refused, TLS) only;
+            # requests that reached Cal.com are never replayed
+            transport=_RateLimitedTransport(
+                # Negotiated via ALPN (needs h2); concurrent calls then share
+                # one connection instead of opening one each. Falls back to
+                # HTTP/1.1 if the server does not offer h2.
+                http2=True,
+                retries=3,
+                # Keep idle connections for 30s rather than httpx's 5s, so
+                # tool calls a few seconds apart still skip the handshake
+                limits=httpx.Limits(
+                    max_keepalive_connections=32,
+                    max_connections=64,
+                    keepalive_expiry=30.0,
+                ),
+            ),
+        )
+    return _http_client
+
+async def warm_http_client() -> None:
+    """
+    Open a pooled connection to Cal.com ahead of the first tool call, so that
+    call does not pay for DNS and the TLS handshake. Failures are ignored.
+    """
+    try:
+        await get_http_client().head("https://api.cal.com/v2/", timeout=2.0)
+    except httpx.HTTPError as e:
+        logger.debug("Could not prewarm Cal.com connection: %s", e)
+
+async def close_http_client() -> None:
+    """
+    Close the shared AsyncClient, if one was created.
+    """
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+async def gather_bounded(
+    fetch: Callable[[Any], Awaitable[dict]], items: Iterable[Any], limit: int = 16
+) -> list[dict]:
+    """
+    Run fetch(item) for every item concurrently, at most `limit` at a time,
+    and return the results in item order.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(item: Any) -> dict:
+        async with semaphore:
+            return await fetch(item)
+
+    return await asyncio.gather(*map(run, items))
+
+def _cache_ttl(response: httpx.Response, default: float) -> Optional[float]:
+    # Honour the response's Cache-Control: no-store is never kept, and a
+    # shorter max-age (0 for no-cache) caps the TTL so the entry is
+    # revalidated sooner
+    cache_control = response.headers.get("Cache-Control", "").lower()
+    if "no-store" in cache_control:
+        return None
+    if "no-cache" in cache_control:
+        return 0.0
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        if name == "max-age":
+            try:
+                return min(default, float(value))
+            except ValueError:
+                break
+    return default
+
+async def cached_get(
+    url: str,
+    headers: dict,
+    params: Optional[dict] = None,
+    ttl: Optional[float] = None,
+) -> httpx.Response:
+    """
+    GET through the shared client, answering repeat requests from a short-lived cache.
+
+    Expired entries that carried an ETag are revalidated with If-None-Match,
+    so an unchanged resource costs a 304 instead of a full body. ttl
+    overrides CAL_COM_CACHE_TTL for this resource.
+    """
+    key = (headers.get("Authorization"), url, tuple(sorted(params.items())) if params else ())
+    entry = _response_cache.get(key)
+    now = time.monotonic()
+    if entry is not None and entry.expires > now:
+        _response_cache.move_to_end(key)
+        return entry.response
+
+    etag = entry.response.headers.get("ETag") if entry is not None else None
+    request_headers = {**headers, "If-None-Match": etag} if etag else headers
+    response = await get_http_client().get(url, headers=request_headers, params=params)
+    if response.status_code == 304 and entry is not None:
+        response = entry.response
+
+    if response.is_success:
+        ttl = _cache_ttl(response, _CACHE_TTL if ttl is None else ttl)
+    else:
+        ttl = None
+    if ttl is not None:
+        _response_cache[key] = _CachedResponse(now + ttl, response)
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > _CACHE_MAXSIZE:
+            _response_cache.popitem(last=False)
+    else:
+        _response_cache.pop(key, None)
+    return response
+
+def calcom_handler(error_message: str, not_found: Optional[str] = None):
+    """
+    Decorate a Cal.com tool so failures come back as {"error": ...} results
+    instead of exceptions, leaving only the success path in the tool body.
+
+    HTTP failures are reported as "<error_message>: <details>". If not_found
+    is given, a 404 returns it instead, formatted with the tool's arguments
+    (e.g. "Webhook not found with ID: {webhook_id}").
+    """
+    def decorator(fn):
+        tool_logger = logging.getLogger(fn.__module__)
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except httpx.HTTPError as e:
+                if (
+                    not_found is not None
+                    and isinstance(e, httpx.HTTPStatusError)
+                    and e.response.status_code == 404
+                ):
+                    message = not_found.format(**signature.bind(*args, **kwargs).arguments)
+                    tool_logger.error(message)
+                    return {"error": message}
+                tool_logger.error("%s: %s", error_message, e)
+                return {"error": f"{error_message}: {e}"}
+            except orjson.JSONDecodeError as e:
+                tool_logger.error("Invalid JSON response from Cal.com: %s", e)
+                return {"error": "Invalid response format from server"}
+            except Exception:
+                tool_logger.exception("Unexpected error in %s", fn.__name__)
+                return {"error": "Unexpected error occurred"}
+
+        return wrapper
+    return decorator
+
+async def calcom_request(
+    method: str,
+    url: str,
+    headers: Mapping[str, str],
+    *,
+    json: Any = None,
+    params: Optional[dict] = None,
+    invalidates: Optional[str] = None,
+    cache: bool = True,
+    cache_ttl: Optional[float] = None,
+) -> Any:
+    """
+    Send a Cal.com API request through the shared client and return the parsed JSON body.
+    Request and response bodies are both handled with orjson.
+
+    GETs are answered from the response cache unless cache=False; cache_ttl
+    overrides the default lifetime of the cached entry. After a
+    successful request, cached responses under the `invalidates` URL prefix
+    are dropped. Raises httpx.HTTPStatusError for error responses.
+    """
+    if method == "GET" and cache:
+        response = await cached_get(url, headers, params, cache_ttl)
+    else:
+        content = None
+        if json is not None:
+            # Serialize with orjson rather than httpx's stdlib json encoder
+            content = orjson.dumps(json)
+            # Tools that send bodies include this in their cached headers
+            # already; only copy the mapping for callers that do not
+            if "Content-Type" not in headers:
+                headers = {**headers, "Content-Type": "application/json"}
+        response = await get_http_client().request(
+            method, url, headers=headers, content=content, params=params
+        )
+    if response.status_code == 401:
+        # The token was rejected (revoked or rotated); stop serving its cached reads
+        invalidate_token(headers.get("Authorization"))
+    response.raise_for_status()
+    if invalidates is not None:
+        invalidate_cached(invalidates)
+    return orjson.loads(response.content)
+
+def invalidate_cached(url_prefix: str) -> None:
+    """
+    Drop cached GET responses for URLs starting with url_prefix, after a write to that resource.
+    """
+    for key in [key for key in _response_cache if key[1].startswith(url_prefix)]:
+        del _response_cache[key]
+
+def invalidate_token(token: Optional[str]) -> None:
+    """
+    Drop every cached GET response fetched with token, after Cal.com rejects it.
+    """
+    for key in [key for key in _response_cache if key[0] == token]:
+        del _response_cache[key]
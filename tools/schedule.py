@@ -1,27 +1,25 @@
-import requests
 import json
 import logging
-from .base import get_calcom_client
+from .base import build_headers, calcom_handler, calcom_request, gather_bounded, get_calcom_client
 
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+_SCHEDULES_URL = "https://api.cal.com/v2/schedules/"
+_DEFAULT_SCHEDULE_URL = _SCHEDULES_URL + "default"
+
 
 def header():
     client = get_calcom_client()
     if not client:
-        logging.error("Could not get Cal.com client")
-        return {"error": "Could not get Cal.com client"}
-    value = {
-    "Authorization": client,
-    "cal-api-version": "2024-06-11"
-    }
-
-    return value
+        logger.error("Could not get Cal.com client")
+        return None
+    return build_headers(client, api_version="2024-06-11", json_body=True)
 
 
 
+@calcom_handler("Could not get Cal.com schedules")
 async def cal_get_all_schedules() -> dict:
     """
     Retrieve all schedules from Cal.com API.
@@ -32,24 +30,16 @@ async def cal_get_all_schedules() -> dict:
     """
     headers = header()
     if not headers:
-        logging.error("Could not get Cal.com client")
         return {"error": "Could not get Cal.com client"}
 
-    url = "https://api.cal.com/v2/schedules/"
-    logging.info(f"Requesting Cal.com schedules from {url}")
-
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()  # Raise exception for HTTP errors
-        logging.info("Successfully retrieved Cal.com schedules")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logging.error(f"Could not get Cal.com schedules from {url}: {e}")
-        return {"error": f"Could not get Cal.com schedules from {url}"}
-    except Exception as e:
-        logging.error(f"Unexpected error when fetching Cal.com schedules: {e}")
-        return {"error": "Unexpected error occurred"}
+    url = _SCHEDULES_URL
+    logger.info("Requesting Cal.com schedules from %s", url)
+
+    result = await calcom_request("GET", url, headers)
+    logger.info("Successfully retrieved Cal.com schedules")
+    return result
 
+@calcom_handler("Could not create Cal.com schedule")
 async def cal_create_a_schedule(
     name: str,
     timeZone: str,
@@ -82,10 +72,9 @@ async def cal_create_a_schedule(
               If failed, dict with "error" key and message.
     """
 
-    url = "https://api.cal.com/v2/schedules/"
+    url = _SCHEDULES_URL
     headers = header()
     if not headers:
-        logging.error("Could not get Cal.com client")
         return {"error": "Could not get Cal.com client"}
 
     payload = {
@@ -99,20 +88,19 @@ async def cal_create_a_schedule(
     if overrides:
         payload["overrides"] = overrides
 
-    logging.info(f"Creating Cal.com schedule: {name}")
+    logger.info("Creating Cal.com schedule: %s", name)
 
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        logging.info("Successfully created Cal.com schedule")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logging.error(f"Could not create Cal.com schedule: {e}")
-        return {"error": f"Could not create Cal.com schedule: {e}"}
-    except Exception as e:
-        logging.error(f"Unexpected error when creating Cal.com schedule: {e}")
-        return {"error": "Unexpected error occurred"}
+    result = await calcom_request(
+        "POST",
+        url,
+        headers,
+        json=payload,
+        invalidates=_SCHEDULES_URL,
+    )
+    logger.info("Successfully created Cal.com schedule")
+    return result
 
+@calcom_handler("Could not update Cal.com schedule")
 async def cal_update_a_schedule(
     schedule_id: int,
     name: str = None,
@@ -147,48 +135,43 @@ async def cal_update_a_schedule(
               If failed, dict with "error" key and message.
     """
 
-    url = "https://api.cal.com/v2/schedules/"
     headers = header()
     if not headers:
-        logging.error("Could not get Cal.com client")
         return {"error": "Could not get Cal.com client"}
 
     if not schedule_id:
-        logging.error("Missing required: schedule_id")
+        logger.error("Missing required: schedule_id")
         return {"error": "Missing required: schedule_id"}
 
-    url_new = url + str(schedule_id)
-    if not headers:
-        logging.error("Could not get Cal.com client")
-        return {"error": "Could not get Cal.com client"}
-
-    payload = {}
+    url = f"{_SCHEDULES_URL}{schedule_id}"
 
-    if name is not None:
-        payload["name"] = name
-    if timeZone is not None:
-        payload["timeZone"] = timeZone
-    if isDefault is not None:
-        payload["isDefault"] = isDefault
-    if availability:
-        payload["availability"] = availability
-    if overrides:
-        payload["overrides"] = overrides
+    # Only send the fields being changed; empty availability/overrides lists
+    # are left out as well
+    payload = {
+        key: value
+        for key, value in (
+            ("name", name),
+            ("timeZone", timeZone),
+            ("isDefault", isDefault),
+            ("availability", availability or None),
+            ("overrides", overrides or None),
+        )
+        if value is not None
+    }
 
-    logging.info(f"Updating Cal.com schedule ID: {schedule_id}")
+    logger.info("Updating Cal.com schedule ID: %s", schedule_id)
 
-    try:
-        response = requests.patch(url_new, json=payload, headers=headers)
-        response.raise_for_status()
-        logging.info("Successfully updated Cal.com schedule")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logging.error(f"Could not update Cal.com schedule: {e}")
-        return {"error": f"Could not update Cal.com schedule: {e}"}
-    except Exception as e:
-        logging.error(f"Unexpected error when updating Cal.com schedule: {e}")
-        return {"error": "Unexpected error occurred"}
+    result = await calcom_request(
+        "PATCH",
+        url,
+        headers,
+        json=payload,
+        invalidates=_SCHEDULES_URL,
+    )
+    logger.info("Successfully updated Cal.com schedule")
+    return result
 
+@calcom_handler("Could not get default schedule")
 async def cal_get_default_schedule() -> dict:
     """
     Get the default schedule from Cal.com.
@@ -198,29 +181,20 @@ async def cal_get_default_schedule() -> dict:
               If failed, dict with "error" key and message.
     """
 
-    url = "https://api.cal.com/v2/schedules/"
-    url_new = url + "default"
+    url = _DEFAULT_SCHEDULE_URL
 
     headers = header()
     if not headers:
-        logging.error("Could not get Cal.com client")
         return {"error": "Could not get Cal.com client"}
 
-    logging.info("Fetching default schedule from Cal.com")
+    logger.info("Fetching default schedule from Cal.com")
 
-    try:
-        response = requests.get(url_new, headers=headers)
-        response.raise_for_status()
-        logging.info("Successfully fetched default schedule")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logging.error(f"Could not get default schedule: {e}")
-        return {"error": f"Could not get default schedule: {e}"}
-    except Exception as e:
-        logging.error(f"Unexpected error when getting default schedule: {e}")
-        return {"error": "Unexpected error occurred"}
+    result = await calcom_request("GET", url, headers)
+    logger.info("Successfully fetched default schedule")
+    return result
 
 
+@calcom_handler("Could not get schedule")
 async def cal_get_schedule(schedule_id: int) -> dict:
     """
     Get a specific schedule from Cal.com by its ID.
@@ -233,31 +207,35 @@ async def cal_get_schedule(schedule_id: int) -> dict:
               If failed, dict with "error" key and message.
     """
 
-    url = "https://api.cal.com/v2/schedules/"
     headers = header()
     if not headers:
-        logging.error("Could not get Cal.com client")
         return {"error": "Could not get Cal.com client"}
 
     if not schedule_id:
-        logging.error("Missing required: schedule_id")
+        logger.error("Missing required: schedule_id")
         return {"error": "Missing required: schedule_id"}
 
-    url_new = url + str(schedule_id)
-    logging.info(f"Fetching Cal.com schedule ID: {schedule_id}")
-
-    try:
-        response = requests.get(url_new, headers=headers)
-        response.raise_for_status()
-        logging.info("Successfully fetched schedule")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logging.error(f"Could not get schedule: {e}")
-        return {"error": f"Could not get schedule: {e}"}
-    except Exception as e:
-        logging.error(f"Unexpected error when getting schedule: {e}")
-        return {"error": "Unexpected error occurred"}
+    url = f"{_SCHEDULES_URL}{schedule_id}"
+    logger.info("Fetching Cal.com schedule ID: %s", schedule_id)
+
+    result = await calcom_request("GET", url, headers)
+    logger.info("Successfully fetched schedule")
+    return result
+
+async def cal_get_schedules_by_ids(schedule_ids: list) -> list:
+    """
+    Get several schedules from Cal.com by ID, fetched concurrently.
+
+    Args:
+        schedule_ids (list): IDs of the schedules to fetch.
+
+    Returns:
+        list: One cal_get_schedule result per ID, in the same order.
+    """
+    logger.info("Fetching %d Cal.com schedules", len(schedule_ids))
+    return await gather_bounded(cal_get_schedule, schedule_ids)
 
+@calcom_handler("Could not delete schedule")
 async def cal_delete_a_schedule(schedule_id: int) -> dict:
     """
     Delete a schedule in Cal.com by its ID.
@@ -270,28 +248,23 @@ async def cal_delete_a_schedule(schedule_id: int) -> dict:
               If failed, dict with "error" key and message.
     """
 
-    url = "https://api.cal.com/v2/schedules/"
     headers = header()
     if not headers:
-        logging.error("Could not get Cal.com client")
         return {"error": "Could not get Cal.com client"}
 
     if not schedule_id:
-        logging.error("Missing required: schedule_id")
+        logger.error("Missing required: schedule_id")
         return {"error": "Missing required: schedule_id"}
 
-    url_new = url + str(schedule_id)
-
-    logging.info(f"Deleting Cal.com schedule ID: {schedule_id}")
-
-    try:
-        response = requests.delete(url_new, headers=headers)
-        response.raise_for_status()
-        logging.info("Successfully deleted schedule")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logging.error(f"Could not delete schedule: {e}")
-        return {"error": f"Could not delete schedule: {e}"}
-    except Exception as e:
-        logging.error(f"Unexpected error when deleting schedule: {e}")
-        return {"error": "Unexpected error occurred"}
\ No newline at end of file
+    url = f"{_SCHEDULES_URL}{schedule_id}"
+
+    logger.info("Deleting Cal.com schedule ID: %s", schedule_id)
+
+    result = await calcom_request(
+        "DELETE",
+        url,
+        headers,
+        invalidates=_SCHEDULES_URL,
+    )
+    logger.info("Successfully deleted schedule")
+    return result
\ No newline at end of file
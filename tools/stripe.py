@@ -1,20 +1,23 @@
-import requests
 import logging
-from .base import get_calcom_client
+from .base import build_headers, calcom_handler, calcom_request, get_calcom_client
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+_STRIPE_URL = "https://api.cal.com/v2/stripe"
+_STRIPE_CONNECT_URL = f"{_STRIPE_URL}/connect"
+_STRIPE_SAVE_URL = f"{_STRIPE_URL}/save"
+_STRIPE_CHECK_URL = f"{_STRIPE_URL}/check"
+
 def header():
     """Retrieve authentication headers for Cal.com API"""
     client = get_calcom_client()
     if not client:
         logger.error("Could not get Cal.com client")
         return None
-    return {
-        "Authorization": client
-    }
+    return build_headers(client)
 
+@calcom_handler("Could not get Stripe Connect URL")
 async def cal_get_stripe_connect_url() -> dict:
     """
     Retrieve Stripe Connect URL from Cal.com API.
@@ -27,21 +30,14 @@ async def cal_get_stripe_connect_url() -> dict:
     if not headers:
         return {"error": "Could not get Cal.com client"}
 
-    url = "https://api.cal.com/v2/stripe/connect"
-    logger.info(f"Requesting Stripe Connect URL from {url}")
-
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        logger.info("Successfully retrieved Stripe Connect URL")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Request failed: {e}")
-        return {"error": f"Request failed: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
-        return {"error": "Unexpected error occurred"}
+    url = _STRIPE_CONNECT_URL
+    logger.info("Requesting Stripe Connect URL from %s", url)
+
+    result = await calcom_request("GET", url, headers, cache=False)
+    logger.info("Successfully retrieved Stripe Connect URL")
+    return result
 
+@calcom_handler("Failed to save credentials")
 async def cal_save_stripe_credentials(state: str, code: str) -> dict:
     """
     Save Stripe credentials in Cal.com.
@@ -58,22 +54,22 @@ async def cal_save_stripe_credentials(state: str, code: str) -> dict:
     if not headers:
         return {"error": "Could not get Cal.com client"}
 
-    url = "https://api.cal.com/v2/stripe/save"
+    url = _STRIPE_SAVE_URL
     params = {"state": state, "code": code}
-    logger.info(f"Saving Stripe credentials with state: {state}")
-
-    try:
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        logger.info("Successfully saved Stripe credentials")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to save credentials: {e}")
-        return {"error": f"Failed to save credentials: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
-        return {"error": "Unexpected error occurred"}
+    logger.info("Saving Stripe credentials with state: %s", state)
+
+    result = await calcom_request(
+        "GET",
+        url,
+        headers,
+        params=params,
+        invalidates=_STRIPE_CHECK_URL,
+        cache=False,
+    )
+    logger.info("Successfully saved Stripe credentials")
+    return result
 
+@calcom_handler("Connection check failed")
 async def cal_check_stripe_connection() -> dict:
     """
     Check Stripe connection status in Cal.com.
@@ -86,17 +82,9 @@ async def cal_check_stripe_connection() -> dict:
     if not headers:
         return {"error": "Could not get Cal.com client"}
 
-    url = "https://api.cal.com/v2/stripe/check"
+    url = _STRIPE_CHECK_URL
     logger.info("Checking Stripe connection status")
 
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        logger.info("Successfully checked Stripe connection")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Connection check failed: {e}")
-        return {"error": f"Connection check failed: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
-        return {"error": "Unexpected error occurred"}
+    result = await calcom_request("GET", url, headers)
+    logger.info("Successfully checked Stripe connection")
+    return result
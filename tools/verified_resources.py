@@ -1,10 +1,18 @@
-import requests
 import logging
-from .base import get_calcom_client
+from .base import build_headers, calcom_handler, calcom_request, gather_bounded, get_calcom_client
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+_VERIFIED_URL = "https://api.cal.com/v2/verified-resources"
+_EMAILS_URL = f"{_VERIFIED_URL}/emails"
+_PHONES_URL = f"{_VERIFIED_URL}/phones"
+
+# Pages requested at once by cal_get_all_verified_phones, and the most it
+# reads before giving up on reaching the end
+_PAGE_WINDOW = 4
+_MAX_PAGES = 40
+
 
 def header():
     """Retrieve authentication headers for Cal.com API"""
@@ -12,11 +20,10 @@ def header():
     if not client:
         logger.error("Could not get Cal.com client")
         return None
-    return {
-        "Authorization": client
-    }
+    return build_headers(client, json_body=True)
 
 
+@calcom_handler("Email verification request failed")
 async def cal_request_email_verification_code(email: str) -> dict:
     """
     Request email verification code from Cal.com API.
@@ -31,24 +38,17 @@ async def cal_request_email_verification_code(email: str) -> dict:
     if not headers:
         return {"error": "Could not get Cal.com client"}
 
-    url = "https://api.cal.com/v2/verified-resources/emails/verification-code/request"
+    url = f"{_EMAILS_URL}/verification-code/request"
     payload = {"email": email}
 
-    logger.info(f"Requesting email verification code for {email}")
+    logger.info("Requesting email verification code for %s", email)
 
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        logger.info("Successfully requested email verification code")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Email verification request failed: {e}")
-        return {"error": f"Email verification request failed: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
-        return {"error": "Unexpected error occurred"}
+    result = await calcom_request("POST", url, headers, json=payload)
+    logger.info("Successfully requested email verification code")
+    return result
 
 
+@calcom_handler("Email verification failed")
 async def cal_verify_email_code(email: str, code: int) -> dict:
     """
     Verify email with received code.
@@ -64,26 +64,25 @@ async def cal_verify_email_code(email: str, code: int) -> dict:
     if not headers:
         return {"error": "Could not get Cal.com client"}
 
-    url = "https://api.cal.com/v2/verified-resources/emails/verification-code/verify"
+    url = f"{_EMAILS_URL}/verification-code/verify"
     payload = {
         "email": str(email),
         "code": str(code)
     }
 
-    logger.info(f"Verifying email {email} with code")
+    logger.info("Verifying email %s with code", email)
 
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        logger.info("Successfully verified email")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Email verification failed: {e}")
-        return {"error": f"Email verification failed: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
-        return {"error": "Unexpected error occurred"}
+    result = await calcom_request(
+        "POST",
+        url,
+        headers,
+        json=payload,
+        invalidates=_EMAILS_URL,
+    )
+    logger.info("Successfully verified email")
+    return result
 
+@calcom_handler("Failed to get verified emails")
 async def cal_get_verified_emails() -> dict:
     """
     Retrieve all verified emails from Cal.com API.
@@ -94,23 +93,16 @@ async def cal_get_verified_emails() -> dict:
     """
     headers = header()
     if not headers:
-        logger.error("Could not get Cal.com client")
         return {"error": "Could not get Cal.com client"}
 
-    url = "https://api.cal.com/v2/verified-resources/emails"
+    url = _EMAILS_URL
     logger.info("Requesting list of verified emails from Cal.com")
 
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()  # Raises exception for HTTP errors
-        logger.info("Successfully retrieved verified emails")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to get verified emails: {e}")
-        return {"error": f"Failed to get verified emails: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"Unexpected error when fetching verified emails: {e}")
-        return {"error": "Unexpected error occurred"}
+    result = await calcom_request("GET", url, headers)
+    logger.info("Successfully retrieved verified emails")
+    return result
+
+@calcom_handler("Could not get verified email", not_found="Verified email not found with ID: {email_id}")
 async def cal_get_verified_email_by_id(email_id: int) -> dict:
     """
     Retrieve a specific verified email by its ID from Cal.com API.
@@ -124,36 +116,32 @@ async def cal_get_verified_email_by_id(email_id: int) -> dict:
     """
     headers = header()
     if not headers:
-        logger.error("Could not get Cal.com client")
         return {"error": "Could not get Cal.com client"}
 
-    url = f"https://api.cal.com/v2/verified-resources/emails/{email_id}"
-    logger.info(f"Requesting verified email with ID: {email_id}")
-
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        logger.info(f"Successfully retrieved verified email ID {email_id}")
-        return response.json()
-    except requests.exceptions.HTTPError as e:
-        if response.status_code == 404:
-            logger.error(f"Verified email not found with ID: {email_id}")
-            return {"error": f"Verified email not found with ID: {email_id}"}
-        logger.error(f"HTTP error getting verified email: {e}")
-        return {"error": f"HTTP error getting verified email: {str(e)}"}
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Request failed for verified email ID {email_id}: {e}")
-        return {"error": f"Request failed: {str(e)}"}
-    except ValueError as e:
-        logger.error(f"Invalid JSON response for email ID {email_id}: {e}")
-        return {"error": "Invalid response format from server"}
-    except Exception as e:
-        logger.exception(f"Unexpected error getting email ID {email_id}: {e}")
-        return {"error": "Unexpected error occurred"}
+    url = f"{_EMAILS_URL}/{email_id}"
+    logger.info("Requesting verified email with ID: %s", email_id)
+
+    result = await calcom_request("GET", url, headers)
+    logger.info("Successfully retrieved verified email ID %s", email_id)
+    return result
+
+async def cal_get_verified_emails_by_ids(email_ids: list) -> list:
+    """
+    Retrieve several verified emails by ID, fetched concurrently.
+
+    Args:
+        email_ids (list): IDs of the verified emails to retrieve
 
+    Returns:
+        list: One cal_get_verified_email_by_id result per ID, in the same order.
+    """
+    logger.info("Requesting %d verified emails", len(email_ids))
+    return await gather_bounded(cal_get_verified_email_by_id, email_ids)
 
 
 #Phone No. Not Working even on Main site, Maybe problem with Indian No, Don't know!
+
+@calcom_handler("Phone verification request failed")
 async def cal_request_phone_verification_code(phone: str) -> dict:
     """
     Request phone verification code from Cal.com API.
@@ -168,24 +156,17 @@ async def cal_request_phone_verification_code(phone: str) -> dict:
     if not headers:
         return {"error": "Could not get Cal.com client"}
 
-    url = "https://api.cal.com/v2/verified-resources/phones/verification-code/request"
+    url = f"{_PHONES_URL}/verification-code/request"
     payload = {"phone": str(phone)}
 
-    logger.info(f"Requesting phone verification code for {phone}")
+    logger.info("Requesting phone verification code for %s", phone)
 
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        logger.info("Successfully requested phone verification code")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Phone verification request failed: {e}")
-        return {"error": f"Phone verification request failed: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
-        return {"error": "Unexpected error occurred"}
+    result = await calcom_request("POST", url, headers, json=payload)
+    logger.info("Successfully requested phone verification code")
+    return result
 
 
+@calcom_handler("Phone verification failed")
 async def cal_verify_phone_code(phone: str, code: int) -> dict:
     """
     Verify phone with received code.
@@ -201,24 +182,23 @@ async def cal_verify_phone_code(phone: str, code: int) -> dict:
     if not headers:
         return {"error": "Could not get Cal.com client"}
 
-    url = "https://api.cal.com/v2/verified-resources/phones/verification-code/verify"
+    url = f"{_PHONES_URL}/verification-code/verify"
     payload = {"phone": str(phone), "code": str(code)}
 
-    logger.info(f"Verifying phone {phone} with code")
+    logger.info("Verifying phone %s with code", phone)
 
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        logger.info("Successfully verified phone")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Phone verification failed: {e}")
-        return {"error": f"Phone verification failed: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
-        return {"error": "Unexpected error occurred"}
+    result = await calcom_request(
+        "POST",
+        url,
+        headers,
+        json=payload,
+        invalidates=_PHONES_URL,
+    )
+    logger.info("Successfully verified phone")
+    return result
 
 
+@calcom_handler("Failed to get verified phones")
 async def cal_get_verified_phones(take: int = 250, skip: int = None) -> dict:
     """
     Retrieve verified phone numbers from Cal.com API with pagination support.
@@ -233,32 +213,85 @@ async def cal_get_verified_phones(take: int = 250, skip: int = None) -> dict:
     """
     headers = header()
     if not headers:
-        logger.error("Could not get Cal.com client")
         return {"error": "Could not get Cal.com client"}
 
-    url = "https://api.cal.com/v2/verified-resources/phones"
+    url = _PHONES_URL
     params = {"take": take}
 
     if skip is not None:
         params["skip"] = skip
 
-    logger.info(f"Requesting verified phones (take: {take}, skip: {skip})")
-
-    try:
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        logger.info(f"Successfully retrieved {take} verified phone records")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to get verified phones: {e}")
-        return {"error": f"Failed to get verified phones: {str(e)}"}
-    except ValueError as e:
-        logger.error(f"Invalid response format: {e}")
-        return {"error": "Invalid response format from server"}
-    except Exception as e:
-        logger.exception(f"Unexpected error when fetching verified phones: {e}")
-        return {"error": "Unexpected error occurred"}
+    logger.info("Requesting verified phones (take: %s, skip: %s)", take, skip)
+
+    result = await calcom_request("GET", url, headers, params=params)
+    logger.info("Successfully retrieved %s verified phone records", take)
+    return result
 
+async def cal_get_all_verified_phones(take: int = 250) -> dict:
+    """
+    Retrieve every verified phone number, following pagination.
+
+    Cal.com does not report a total count, so after a full first page the
+    following pages are fetched concurrently, _PAGE_WINDOW at a time, until
+    one comes back short. Reading stops early, with "truncated": true, after
+    _MAX_PAGES pages or when a window adds no new phone IDs (e.g. if skip
+    is ignored), so the result is always bounded.
+
+    Args:
+        take (int): Page size used for each request (default: 250, max: 250)
+
+    Returns:
+        dict: On success → {"status": "success", "data": [all phone records],
+              "truncated": bool}.
+              On failure → the first page's error dict.
+    """
+    page = await cal_get_verified_phones(take=take)
+    if "error" in page:
+        return page
+    phones = list(page.get("data") or [])
+    seen = {phone.get("id") for phone in phones}
+    skip = take
+    pages_read = 1
+    done = len(phones) < take
+    truncated = False
+    while not done:
+        if pages_read >= _MAX_PAGES:
+            truncated = True
+            break
+        window = min(_PAGE_WINDOW, _MAX_PAGES - pages_read)
+        pages = await gather_bounded(
+            lambda offset: cal_get_verified_phones(take=take, skip=offset),
+            range(skip, skip + window * take, take),
+        )
+        added = 0
+        for page in pages:
+            if "error" in page:
+                return page
+            data = page.get("data") or []
+            for phone in data:
+                phone_id = phone.get("id")
+                # Records repeat when skip is ignored or the list shifts
+                if phone_id is None or phone_id not in seen:
+                    seen.add(phone_id)
+                    phones.append(phone)
+                    added += 1
+            if len(data) < take:
+                done = True
+                break
+        pages_read += window
+        skip += window * take
+        if not done and not added:
+            truncated = True
+            break
+    if truncated:
+        logger.warning(
+            "Stopped paging verified phones after %d pages with %d records",
+            pages_read, len(phones),
+        )
+    logger.info("Retrieved %d verified phone records", len(phones))
+    return {"status": "success", "data": phones, "truncated": truncated}
+
+@calcom_handler("Could not get verified phone", not_found="Verified phone not found with ID: {phone_id}")
 async def cal_get_verified_phone_by_id(phone_id: int) -> dict:
     """
     Retrieve a specific verified phone number by its ID from Cal.com API.
@@ -272,29 +305,24 @@ async def cal_get_verified_phone_by_id(phone_id: int) -> dict:
     """
     headers = header()
     if not headers:
-        logger.error("Could not get Cal.com client")
         return {"error": "Could not get Cal.com client"}
 
-    url = f"https://api.cal.com/v2/verified-resources/phones/{phone_id}"
-    logger.info(f"Requesting verified phone with ID: {phone_id}")
-
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        logger.info(f"Successfully retrieved verified phone ID {phone_id}")
-        return response.json()
-    except requests.exceptions.HTTPError as e:
-        if response.status_code == 404:
-            logger.error(f"Verified phone not found with ID: {phone_id}")
-            return {"error": f"Verified phone not found with ID: {phone_id}"}
-        logger.error(f"HTTP error getting verified phone: {e}")
-        return {"error": f"HTTP error getting verified phone: {str(e)}"}
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Request failed for verified phone ID {phone_id}: {e}")
-        return {"error": f"Request failed: {str(e)}"}
-    except ValueError as e:
-        logger.error(f"Invalid JSON response for phone ID {phone_id}: {e}")
-        return {"error": "Invalid response format from server"}
-    except Exception as e:
-        logger.exception(f"Unexpected error getting phone ID {phone_id}: {e}")
-        return {"error": "Unexpected error occurred"}
\ No newline at end of file
+    url = f"{_PHONES_URL}/{phone_id}"
+    logger.info("Requesting verified phone with ID: %s", phone_id)
+
+    result = await calcom_request("GET", url, headers)
+    logger.info("Successfully retrieved verified phone ID %s", phone_id)
+    return result
+
+async def cal_get_verified_phones_by_ids(phone_ids: list) -> list:
+    """
+    Retrieve several verified phone numbers by ID, fetched concurrently.
+
+    Args:
+        phone_ids (list): IDs of the verified phone numbers to retrieve
+
+    Returns:
+        list: One cal_get_verified_phone_by_id result per ID, in the same order.
+    """
+    logger.info("Requesting %d verified phones", len(phone_ids))
+    return await gather_bounded(cal_get_verified_phone_by_id, phone_ids)
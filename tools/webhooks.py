@@ -1,10 +1,26 @@
-import requests
 import logging
-from .base import get_calcom_client
+import os
+from .base import (
+    WEBHOOK_TRIGGERS,
+    build_headers,
+    calcom_handler,
+    calcom_request,
+    gather_bounded,
+    get_calcom_client,
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Webhook reads are cached for less time than the default, since other
+# clients may edit webhooks; this server's own writes invalidate them
+_CACHE_TTL = float(os.getenv("CAL_COM_WEBHOOKS_CACHE_TTL", "15"))
+
+_WEBHOOKS_URL = "https://api.cal.com/v2/webhooks"
+
+# Lets create/update reject unknown triggers without a request
+_VALID_TRIGGERS = frozenset(WEBHOOK_TRIGGERS)
+
 
 def header():
     """Retrieve authentication headers for Cal.com API"""
@@ -12,12 +28,10 @@ def header():
     if not client:
         logger.error("Could not get Cal.com client")
         return None
-    return {
-        "Authorization": client,
-        "Content-Type": "application/json"
-    }
+    return build_headers(client, json_body=True)
 
 
+@calcom_handler("Failed to get webhooks")
 async def cal_get_all_webhooks(take: int = 250, skip: int = None) -> dict:
     """
     Retrieve all webhooks with pagination support.
@@ -33,29 +47,21 @@ async def cal_get_all_webhooks(take: int = 250, skip: int = None) -> dict:
     if not headers:
         return {"error": "Could not get Cal.com client"}
 
-    url = "https://api.cal.com/v2/webhooks"
-    params = {}
-
-    if take is not None:
-        params["take"] = take
-    if skip is not None:
-        params["skip"] = skip
+    url = _WEBHOOKS_URL
+    params = {
+        key: value
+        for key, value in (("take", take), ("skip", skip))
+        if value is not None
+    }
 
-    logger.info(f"Requesting webhooks (take: {take}, skip: {skip})")
+    logger.info("Requesting webhooks (take: %s, skip: %s)", take, skip)
 
-    try:
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        logger.info("Successfully retrieved webhooks")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Failed to get webhooks: {e}")
-        return {"error": f"Failed to get webhooks: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
-        return {"error": "Unexpected error occurred"}
+    result = await calcom_request("GET", url, headers, params=params, cache_ttl=_CACHE_TTL)
+    logger.info("Successfully retrieved webhooks")
+    return result
 
 
+@calcom_handler("Webhook creation failed")
 async def cal_create_webhook(
     active: bool,
     subscriberUrl: str,
@@ -131,33 +137,38 @@ async def cal_create_webhook(
     if not headers:
         return {"error": "Could not get Cal.com client"}
 
-    url = "https://api.cal.com/v2/webhooks"
+    bad = [t for t in triggers if t not in _VALID_TRIGGERS]
+    if bad:
+        return {"error": f"Invalid triggers: {bad}"}
+
+    url = _WEBHOOKS_URL
+    # Empty payloadTemplate/secret strings are left out, as before
     payload = {
-        "active": active,
-        "subscriberUrl": subscriberUrl,
-        "triggers": triggers
+        key: value
+        for key, value in (
+            ("active", active),
+            ("subscriberUrl", subscriberUrl),
+            ("triggers", triggers),
+            ("payloadTemplate", payloadTemplate or None),
+            ("secret", secret or None),
+        )
+        if value is not None
     }
 
-    if payloadTemplate:
-        payload["payloadTemplate"] = payloadTemplate
-    if secret:
-        payload["secret"] = secret
+    logger.info("Creating webhook for URL: %s", subscriberUrl)
 
-    logger.info(f"Creating webhook for URL: {subscriberUrl}")
-
-    try:
-        response = requests.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        logger.info("Successfully created webhook")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Webhook creation failed: {e}")
-        return {"error": f"Webhook creation failed: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
-        return {"error": "Unexpected error occurred"}
+    result = await calcom_request(
+        "POST",
+        url,
+        headers,
+        json=payload,
+        invalidates=_WEBHOOKS_URL,
+    )
+    logger.info("Successfully created webhook")
+    return result
 
 
+@calcom_handler("Could not get webhook", not_found="Webhook not found with ID: {webhook_id}")
 async def cal_get_webhook(webhook_id: str) -> dict:
     """
     Get a specific webhook by ID.
@@ -172,28 +183,15 @@ async def cal_get_webhook(webhook_id: str) -> dict:
     if not headers:
         return {"error": "Could not get Cal.com client"}
 
-    url = f"https://api.cal.com/v2/webhooks/{webhook_id}"
-    logger.info(f"Requesting webhook with ID: {webhook_id}")
-
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        logger.info(f"Successfully retrieved webhook ID {webhook_id}")
-        return response.json()
-    except requests.exceptions.HTTPError as e:
-        if response.status_code == 404:
-            logger.error(f"Webhook not found with ID: {webhook_id}")
-            return {"error": f"Webhook not found with ID: {webhook_id}"}
-        logger.error(f"HTTP error getting webhook: {e}")
-        return {"error": f"HTTP error getting webhook: {str(e)}"}
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Request failed for webhook ID {webhook_id}: {e}")
-        return {"error": f"Request failed: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"Unexpected error getting webhook ID {webhook_id}: {e}")
-        return {"error": "Unexpected error occurred"}
+    url = f"{_WEBHOOKS_URL}/{webhook_id}"
+    logger.info("Requesting webhook with ID: %s", webhook_id)
+
+    result = await calcom_request("GET", url, headers, cache_ttl=_CACHE_TTL)
+    logger.info("Successfully retrieved webhook ID %s", webhook_id)
+    return result
 
 
+@calcom_handler("Webhook update failed")
 async def cal_update_webhook(
     webhook_id: str,
     active: bool = None,
@@ -213,7 +211,7 @@ async def cal_update_webhook(
         subscriberUrl (str, optional): New URL to receive webhook payloads
         triggers (list[str], optional): Updated list of trigger events. Valid options:
             - BOOKING_CREATED
-            - BOOKING_PAYMENT_INITITATED
+            - BOOKING_PAYMENT_INITIATED
             - BOOKING_PAID
             - BOOKING_RESCHEDULED
             - BOOKING_REQUESTED
@@ -274,35 +272,39 @@ async def cal_update_webhook(
     if not headers:
         return {"error": "Could not get Cal.com client"}
 
-    url = f"https://api.cal.com/v2/webhooks/{webhook_id}"
-    payload = {}
-
-    if active is not None:
-        payload["active"] = active
-    if subscriberUrl is not None:
-        payload["subscriberUrl"] = subscriberUrl
     if triggers is not None:
-        payload["triggers"] = triggers
-    if payloadTemplate is not None:
-        payload["payloadTemplate"] = payloadTemplate
-    if secret is not None:
-        payload["secret"] = secret
-
-    logger.info(f"Updating webhook with ID: {webhook_id}")
-
-    try:
-        response = requests.patch(url, json=payload, headers=headers)
-        response.raise_for_status()
-        logger.info(f"Successfully updated webhook ID {webhook_id}")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Webhook update failed: {e}")
-        return {"error": f"Webhook update failed: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
-        return {"error": "Unexpected error occurred"}
+        bad = [t for t in triggers if t not in _VALID_TRIGGERS]
+        if bad:
+            return {"error": f"Invalid triggers: {bad}"}
 
+    url = f"{_WEBHOOKS_URL}/{webhook_id}"
+    # Only send the fields being changed
+    payload = {
+        key: value
+        for key, value in (
+            ("active", active),
+            ("subscriberUrl", subscriberUrl),
+            ("triggers", triggers),
+            ("payloadTemplate", payloadTemplate),
+            ("secret", secret),
+        )
+        if value is not None
+    }
 
+    logger.info("Updating webhook with ID: %s", webhook_id)
+
+    result = await calcom_request(
+        "PATCH",
+        url,
+        headers,
+        json=payload,
+        invalidates=_WEBHOOKS_URL,
+    )
+    logger.info("Successfully updated webhook ID %s", webhook_id)
+    return result
+
+
+@calcom_handler("Webhook deletion failed")
 async def cal_delete_webhook(webhook_id: str) -> dict:
     """
     Delete a webhook by ID.
@@ -317,17 +319,71 @@ async def cal_delete_webhook(webhook_id: str) -> dict:
     if not headers:
         return {"error": "Could not get Cal.com client"}
 
-    url = f"https://api.cal.com/v2/webhooks/{webhook_id}"
-    logger.info(f"Deleting webhook with ID: {webhook_id}")
-
-    try:
-        response = requests.delete(url, headers=headers)
-        response.raise_for_status()
-        logger.info(f"Successfully deleted webhook ID {webhook_id}")
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Webhook deletion failed: {e}")
-        return {"error": f"Webhook deletion failed: {str(e)}"}
-    except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
-        return {"error": "Unexpected error occurred"}
+    url = f"{_WEBHOOKS_URL}/{webhook_id}"
+    logger.info("Deleting webhook with ID: %s", webhook_id)
+
+    result = await calcom_request(
+        "DELETE",
+        url,
+        headers,
+        invalidates=_WEBHOOKS_URL,
+    )
+    logger.info("Successfully deleted webhook ID %s", webhook_id)
+    return result
+
+
+async def cal_get_webhooks_by_ids(webhook_ids: list) -> list:
+    """
+    Get several webhooks by ID, fetched concurrently.
+
+    Args:
+        webhook_ids (list): IDs of the webhooks to retrieve
+
+    Returns:
+        list: One cal_get_webhook result per ID, in the same order
+    """
+    logger.info("Requesting %d webhooks", len(webhook_ids))
+    return await gather_bounded(cal_get_webhook, webhook_ids)
+
+
+async def cal_create_webhooks(webhooks: list) -> list:
+    """
+    Create several webhooks concurrently.
+
+    Args:
+        webhooks (list): One dict of cal_create_webhook arguments per webhook
+
+    Returns:
+        list: One cal_create_webhook result per webhook, in the same order
+    """
+    logger.info("Creating %d webhooks", len(webhooks))
+    return await gather_bounded(lambda spec: cal_create_webhook(**spec), webhooks)
+
+
+async def cal_update_webhooks(webhooks: list) -> list:
+    """
+    Update several webhooks concurrently.
+
+    Args:
+        webhooks (list): One dict of cal_update_webhook arguments per webhook,
+            each including webhook_id
+
+    Returns:
+        list: One cal_update_webhook result per webhook, in the same order
+    """
+    logger.info("Updating %d webhooks", len(webhooks))
+    return await gather_bounded(lambda spec: cal_update_webhook(**spec), webhooks)
+
+
+async def cal_delete_webhooks(webhook_ids: list) -> list:
+    """
+    Delete several webhooks by ID concurrently.
+
+    Args:
+        webhook_ids (list): IDs of the webhooks to delete
+
+    Returns:
+        list: One cal_delete_webhook result per ID, in the same order
+    """
+    logger.info("Deleting %d webhooks", len(webhook_ids))
+    return await gather_bounded(cal_delete_webhook, webhook_ids)